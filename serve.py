@@ -3,16 +3,238 @@
 Simple HTTP server for local development of the Linux Hardware Compatibility Database
 """
 import http.server
-import socketserver
 import os
 import sys
-from urllib.parse import urlparse, parse_qs
+import errno
+import signal
+import socket
+import contextlib
 import json
-import mimetypes
+import threading
+import time
+import itertools
+import functools
+import hashlib
+import email.utils
+import gzip
+import io
+from collections import namedtuple
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Prefer orjson for encoding/decoding when available; it works on bytes directly
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+    _loads = json.loads
+
+# Stream-parse request bodies and database statistics with ijson when available
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Static files are served from the directory containing this script
+WEB_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+HARDWARE_DATABASE = 'data/hardware-database.json'
+CONFIGURATION_TIPS = 'data/configuration-tips.json'
+
+CACHE_CONTROL = 'public, max-age=600'
+
+# Moderate brotli quality; the default of 11 is far slower than gzip level 6
+BROTLI_QUALITY = 5
+
+# Responses up to this size (headers included) leave the server in a single send()
+WRITE_BUFFER_SIZE = 64 * 1024
+
+# A response body, its precompressed variants and the validators used for conditional GETs.
+# brotli_body is None when the brotli module is not installed.
+CachedResponse = namedtuple('CachedResponse', [
+    'body', 'gzip_body', 'brotli_body', 'etag', 'last_modified', 'mtime'
+])
+
+# Cached file responses keyed by path, as (mtime_ns, CachedResponse). Unlike an LRU
+# keyed on (path, mtime), this holds only the current version of each file.
+_FILE_CACHE = {}
+
+# One lock per path, so reading and compressing one file never blocks misses on another.
+# _FILE_LOCKS_LOCK only guards creating them.
+_FILE_LOCKS = {}
+_FILE_LOCKS_LOCK = threading.Lock()
+
+# Generated submission IDs: a per-process prefix plus a counter, so no clock read per request
+_SUBMISSION_PREFIX = str(time.time_ns())
+_SUBMISSION_SEQ = itertools.count(1)
+
+def _reset_submission_ids():
+    """Give a forked worker its own ID prefix so workers never hand out the same ID"""
+    global _SUBMISSION_PREFIX, _SUBMISSION_SEQ
+    _SUBMISSION_PREFIX = str(time.time_ns())
+    _SUBMISSION_SEQ = itertools.count(1)
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_submission_ids)
+
+def _next_submission_id(kind):
+    """Return a new ID like 'hw_<process start ns>_<n>' for a submission without one"""
+    return f'{kind}_{_SUBMISSION_PREFIX}_{next(_SUBMISSION_SEQ)}'
+
+def _ack_template(message):
+    """Pre-serialize a submission acknowledgement up to its 'id' value"""
+    return _dumps({'status': 'success', 'message': message, 'id': None})[:-len(b'null}')]
+
+# Acknowledgements are completed with _dumps(id) + b'}', so only the ID is encoded per request
+_HARDWARE_ACK = _ack_template('Hardware report received and will be processed')
+_TIP_ACK = _ack_template('Configuration tip submitted for moderation')
+
+def _make_response(body, mtime_ns):
+    """Build a CachedResponse for a body last changed at mtime_ns"""
+    mtime = mtime_ns // 1_000_000_000
+    return CachedResponse(
+        body=body,
+        gzip_body=gzip.compress(body, compresslevel=6),
+        brotli_body=brotli.compress(body, quality=BROTLI_QUALITY) if brotli is not None else None,
+        etag='"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"',
+        last_modified=email.utils.formatdate(mtime, usegmt=True),
+        mtime=mtime,
+    )
+
+def _accepted_encodings(header):
+    """Return the content codings an Accept-Encoding header allows"""
+    accepted = set()
+    for item in header.split(','):
+        coding, *params = item.split(';')
+        coding = coding.strip().lower()
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if coding and quality > 0:
+            accepted.add(coding)
+    return accepted
+
+def _load_file(path):
+    """Return the cached response for a file, re-reading it only when its mtime changes"""
+    mtime_ns = os.stat(path).st_mtime_ns
+    cached = _FILE_CACHE.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    
+    with _FILE_LOCKS_LOCK:
+        lock = _FILE_LOCKS.setdefault(path, threading.Lock())
+    
+    # Re-check under the path's lock so concurrent misses only read the file once
+    with lock:
+        cached = _FILE_CACHE.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        with open(path, 'rb') as f:
+            response = _make_response(f.read(), mtime_ns)
+        _FILE_CACHE[path] = (mtime_ns, response)
+        return response
+
+def _read_statistics(body):
+    """Return a database's top-level 'statistics' object, skipping the rest of the
+    document instead of building it when ijson is available"""
+    if ijson is None:
+        return _loads(body).get('statistics', {})
+    for statistics in ijson.items(body, 'statistics', use_float=True):
+        return statistics
+    return {}
+
+# lru_cache doesn't stop concurrent misses from each running _render_statistics(), so a
+# burst of requests after a data change would all re-walk the databases without this
+_STATISTICS_LOCK = threading.Lock()
+
+@functools.lru_cache(maxsize=8)
+def _render_statistics(mtimes):
+    """Build the combined statistics response from the databases' current contents.
+    
+    `mtimes` only serves as the cache key; the data itself is whatever _load_file()
+    returns at call time."""
+    hardware_stats = _read_statistics(_load_file(HARDWARE_DATABASE).body)
+    tips_stats = _read_statistics(_load_file(CONFIGURATION_TIPS).body)
+    
+    # Combine statistics
+    combined_stats = {
+        'hardware': hardware_stats,
+        'tips': tips_stats,
+        'combined': {
+            'total_entries': hardware_stats['total_hardware'] + tips_stats['total_tips'],
+            'last_updated': max(
+                hardware_stats['last_updated'],
+                tips_stats['last_updated']
+            )
+        }
+    }
+    
+    return _make_response(_dumps(combined_stats), max(mtimes))
+
+def _load_statistics():
+    """Return the combined statistics response, recomputed only when either database changes"""
+    mtimes = (os.stat(HARDWARE_DATABASE).st_mtime_ns, os.stat(CONFIGURATION_TIPS).st_mtime_ns)
+    with _STATISTICS_LOCK:
+        return _render_statistics(mtimes)
+
+def _sendmsg_all(sock, buffers):
+    """Send several buffers with one vectored sendmsg(), finishing any partial write with sendall()"""
+    sent = sock.sendmsg(buffers)
+    for buf in buffers:
+        if sent >= len(buf):
+            sent -= len(buf)
+            continue
+        sock.sendall(memoryview(buf)[sent:])
+        sent = 0
+
+class _LimitedReader(io.RawIOBase):
+    """Read-only stream exposing at most `limit` bytes of an underlying binary file"""
+    def __init__(self, raw, limit):
+        self.raw = raw
+        self.remaining = limit
+    
+    def readable(self):
+        return True
+    
+    def readinto(self, b):
+        if self.remaining <= 0:
+            return 0
+        n = self.raw.readinto(memoryview(b)[:self.remaining])
+        self.remaining -= n
+        return n
 
 class LXHWDBHandler(http.server.SimpleHTTPRequestHandler):
+    # API endpoints mapped to the names of the methods handling them
+    _GET_ROUTES = {
+        '/api/hardware': 'serve_hardware_database',
+        '/api/tips': 'serve_configuration_tips',
+        '/api/statistics': 'serve_statistics',
+    }
+    _POST_ROUTES = {
+        '/api/hardware/submit': 'handle_hardware_submission',
+        '/api/tips/submit': 'handle_tip_submission',
+    }
+    
+    # Buffer wfile so the status line, headers and body are coalesced instead of each
+    # flush_headers()/write() call going straight to the socket
+    wbufsize = WRITE_BUFFER_SIZE
+    
+    # Body too large for the write buffer, sent along with the headers by flush_headers()
+    _pending_body = None
+    
     def __init__(self, *args, **kwargs):
-        super().__init__(*args, directory=os.path.dirname(os.path.abspath(__file__)), **kwargs)
+        super().__init__(*args, directory=WEB_ROOT, **kwargs)
     
     def end_headers(self):
         # Add CORS headers for local development
@@ -21,45 +243,158 @@ class LXHWDBHandler(http.server.SimpleHTTPRequestHandler):
         self.send_header('Access-Control-Allow-Headers', 'Content-Type')
         super().end_headers()
     
+    def flush_headers(self):
+        if self._pending_body is None:
+            return super().flush_headers()
+        
+        # Hand the header block and the body to the kernel in a single sendmsg()
+        headers = b''.join(self._headers_buffer)
+        body, self._headers_buffer, self._pending_body = self._pending_body, [], None
+        self.wfile.flush()
+        try:
+            _sendmsg_all(self.connection, [headers, body])
+        except NotImplementedError:  # SSL sockets have no sendmsg()
+            self.wfile.write(headers)
+            self.wfile.write(body)
+    
     def do_OPTIONS(self):
         self.send_response(200)
         self.end_headers()
     
+    def copyfile(self, source, outputfile):
+        """Copy static files to the client with sendfile(2) instead of through userspace buffers"""
+        # In-memory sources (directory listings) and small files just go through the write
+        # buffer, leaving in the same send() as the headers
+        if (outputfile is not self.wfile or isinstance(source, io.BytesIO)
+                or os.fstat(source.fileno()).st_size <= WRITE_BUFFER_SIZE):
+            return super().copyfile(source, outputfile)
+        
+        # socket.sendfile() falls back to plain send() for SSL sockets
+        self.wfile.flush()
+        self.connection.sendfile(source)
+    
+    def select_encoding(self, response):
+        """Pick the smallest body variant the client accepts, as (body, etag, content_encoding)"""
+        accepted = _accepted_encodings(self.headers.get('Accept-Encoding', ''))
+        if response.brotli_body is not None and 'br' in accepted:
+            return response.brotli_body, response.etag[:-1] + '-br"', 'br'
+        if 'gzip' in accepted:
+            return response.gzip_body, response.etag[:-1] + '-gz"', 'gzip'
+        return response.body, response.etag, None
+    
+    def is_not_modified(self, etag, mtime):
+        """Check the request's conditional headers against a response's validators"""
+        if_none_match = self.headers.get('If-None-Match')
+        if if_none_match is not None:
+            # If-None-Match takes precedence over If-Modified-Since (RFC 7232)
+            tags = [tag.strip() for tag in if_none_match.split(',')]
+            return '*' in tags or etag in tags or 'W/' + etag in tags
+        
+        if_modified_since = self.headers.get('If-Modified-Since')
+        if if_modified_since is not None:
+            try:
+                since = email.utils.parsedate_to_datetime(if_modified_since)
+            except (TypeError, IndexError, OverflowError, ValueError):
+                return False
+            if since.tzinfo is None:
+                return False
+            return mtime <= since.timestamp()
+        
+        return False
+    
+    def send_cached_json(self, response):
+        """Send a cached JSON response, compressed if the client allows it and
+        answering conditional requests with 304"""
+        body, etag, content_encoding = self.select_encoding(response)
+        headers = [
+            ('ETag', etag),
+            ('Last-Modified', response.last_modified),
+            ('Cache-Control', CACHE_CONTROL),
+            ('Vary', 'Accept-Encoding'),
+        ]
+        
+        if self.is_not_modified(etag, response.mtime):
+            self.send_json(b'', status=304, headers=headers)
+            return
+        
+        if content_encoding is not None:
+            headers.append(('Content-Encoding', content_encoding))
+        self.send_json(body, headers=headers)
+    
+    def send_json(self, body, status=200, headers=()):
+        """Send a complete JSON response"""
+        self.send_response(status)
+        if status != 304:
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        
+        # HTTP/0.9 responses have no headers, so flush_headers() is never called for them
+        if len(body) > WRITE_BUFFER_SIZE and self.request_version != 'HTTP/0.9':
+            self._pending_body = body
+            self.end_headers()
+            return
+        
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def request_path(self):
+        """Return the request path without its query string or fragment"""
+        return self.path.partition('?')[0].partition('#')[0]
+    
     def do_GET(self):
-        parsed_path = urlparse(self.path)
+        path = self.request_path()
         
         # Handle API endpoints
-        if parsed_path.path.startswith('/api/'):
-            return self.handle_api_request(parsed_path)
+        if path.startswith('/api/'):
+            return self.handle_api_request(path)
         
         # Serve static files
         return super().do_GET()
     
     def do_POST(self):
-        parsed_path = urlparse(self.path)
+        path = self.request_path()
         
         # Handle API POST requests
-        if parsed_path.path.startswith('/api/'):
-            return self.handle_api_post(parsed_path)
+        if path.startswith('/api/'):
+            return self.handle_api_post(path)
         
         self.send_error(404, "Not Found")
     
-    def handle_api_request(self, parsed_path):
+    def handle_api_request(self, path):
         """Handle API GET requests"""
-        path = parsed_path.path
-        
-        if path == '/api/hardware':
-            return self.serve_hardware_database()
-        elif path == '/api/tips':
-            return self.serve_configuration_tips()
-        elif path == '/api/statistics':
-            return self.serve_statistics()
-        else:
+        
+        handler = self._GET_ROUTES.get(path)
+        if handler is None:
             self.send_error(404, f"API endpoint not found: {path}")
+            return
+        return getattr(self, handler)()
     
-    def handle_api_post(self, parsed_path):
+    def read_json_body(self, content_length):
+        """Parse the request body as JSON, streaming it through ijson when available"""
+        if ijson is None:
+            return _loads(self.rfile.read(content_length))
+        
+        body = _LimitedReader(self.rfile, content_length)
+        items = ijson.items(body, '', use_float=True)
+        try:
+            for data in items:
+                # Run the parser to the end so trailing data is rejected like a full parse would
+                for _ in items:
+                    raise json.JSONDecodeError("Extra data", '', 0)
+                return data
+        except ijson.JSONError as e:
+            raise json.JSONDecodeError(str(e), '', 0) from e
+        raise json.JSONDecodeError("Empty request body", '', 0)
+    
+    def handle_api_post(self, path):
         """Handle API POST requests for data submission"""
-        path = parsed_path.path
+        handler = self._POST_ROUTES.get(path)
+        if handler is None:
+            self.send_error(404, f"API endpoint not found: {path}")
+            return
+        
         content_length = int(self.headers.get('content-length', 0))
         
         if content_length > 10 * 1024 * 1024:  # 10MB limit
@@ -67,16 +402,9 @@ class LXHWDBHandler(http.server.SimpleHTTPRequestHandler):
             return
         
         try:
-            post_data = self.rfile.read(content_length)
-            data = json.loads(post_data.decode('utf-8'))
+            data = self.read_json_body(content_length)
+            return getattr(self, handler)(data)
             
-            if path == '/api/hardware/submit':
-                return self.handle_hardware_submission(data)
-            elif path == '/api/tips/submit':
-                return self.handle_tip_submission(data)
-            else:
-                self.send_error(404, f"API endpoint not found: {path}")
-                
         except json.JSONDecodeError:
             self.send_error(400, "Invalid JSON data")
         except Exception as e:
@@ -86,13 +414,7 @@ class LXHWDBHandler(http.server.SimpleHTTPRequestHandler):
     def serve_hardware_database(self):
         """Serve the hardware database"""
         try:
-            with open('data/hardware-database.json', 'r') as f:
-                data = json.load(f)
-            
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(data).encode('utf-8'))
+            self.send_cached_json(_load_file(HARDWARE_DATABASE))
             
         except FileNotFoundError:
             self.send_error(404, "Hardware database not found")
@@ -103,13 +425,7 @@ class LXHWDBHandler(http.server.SimpleHTTPRequestHandler):
     def serve_configuration_tips(self):
         """Serve the configuration tips database"""
         try:
-            with open('data/configuration-tips.json', 'r') as f:
-                data = json.load(f)
-            
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(data).encode('utf-8'))
+            self.send_cached_json(_load_file(CONFIGURATION_TIPS))
             
         except FileNotFoundError:
             self.send_error(404, "Configuration tips database not found")
@@ -120,30 +436,7 @@ class LXHWDBHandler(http.server.SimpleHTTPRequestHandler):
     def serve_statistics(self):
         """Serve combined statistics"""
         try:
-            # Load both databases
-            with open('data/hardware-database.json', 'r') as f:
-                hardware_data = json.load(f)
-            
-            with open('data/configuration-tips.json', 'r') as f:
-                tips_data = json.load(f)
-            
-            # Combine statistics
-            combined_stats = {
-                'hardware': hardware_data.get('statistics', {}),
-                'tips': tips_data.get('statistics', {}),
-                'combined': {
-                    'total_entries': hardware_data['statistics']['total_hardware'] + tips_data['statistics']['total_tips'],
-                    'last_updated': max(
-                        hardware_data['statistics']['last_updated'],
-                        tips_data['statistics']['last_updated']
-                    )
-                }
-            }
-            
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps(combined_stats).encode('utf-8'))
+            self.send_cached_json(_load_statistics())
             
         except Exception as e:
             print(f"Error serving statistics: {e}")
@@ -160,16 +453,8 @@ class LXHWDBHandler(http.server.SimpleHTTPRequestHandler):
         # 4. Return success/failure
         
         # For now, just acknowledge receipt
-        response = {
-            'status': 'success',
-            'message': 'Hardware report received and will be processed',
-            'id': data.get('id', f'hw_{int(os.time())}')
-        }
-        
-        self.send_response(200)
-        self.send_header('Content-Type', 'application/json')
-        self.end_headers()
-        self.wfile.write(json.dumps(response).encode('utf-8'))
+        submission_id = data.get('id') or _next_submission_id('hw')
+        self.send_json(_HARDWARE_ACK + _dumps(submission_id) + b'}')
     
     def handle_tip_submission(self, data):
         """Handle configuration tip submission"""
@@ -181,16 +466,82 @@ class LXHWDBHandler(http.server.SimpleHTTPRequestHandler):
         # 3. Add to moderation queue
         # 4. Return success/failure
         
-        response = {
-            'status': 'success', 
-            'message': 'Configuration tip submitted for moderation',
-            'id': data.get('id', f'tip_{int(os.time())}')
-        }
-        
-        self.send_response(200)
-        self.send_header('Content-Type', 'application/json')
-        self.end_headers()
-        self.wfile.write(json.dumps(response).encode('utf-8'))
+        submission_id = data.get('id') or _next_submission_id('tip')
+        self.send_json(_TIP_ACK + _dumps(submission_id) + b'}')
+
+class LXHWDBServer(http.server.ThreadingHTTPServer):
+    """HTTP server handling each request in its own thread"""
+    # Don't let stuck worker threads block Ctrl+C, and allow quick restarts
+    daemon_threads = True
+    allow_reuse_address = True
+    
+    def __init__(self, server_address, handler_class, reuse_port=False):
+        # With SO_REUSEPORT several worker processes each bind their own socket to the
+        # same port and the kernel balances incoming connections between them
+        self.allow_reuse_port = reuse_port
+        super().__init__(server_address, handler_class)
+    
+    def server_bind(self):
+        # socketserver only honours allow_reuse_port by itself from Python 3.11
+        if self.allow_reuse_port:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+def _run_worker(server, servers):
+    """Serve requests in a forked worker process; never returns"""
+    status = 0
+    try:
+        # Only keep this worker's listening socket open
+        for other in servers:
+            if other is not server:
+                other.server_close()
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        print(f"❌ Worker {os.getpid()} failed: {e}")
+        status = 1
+    finally:
+        sys.stdout.flush()
+        os._exit(status)
+
+def _run_workers(servers):
+    """Fork one worker process per server, shutting them all down as soon as one exits"""
+    # Don't let the children inherit (and later repeat) buffered output
+    sys.stdout.flush()
+    pids = set()
+    for server in servers:
+        pid = os.fork()
+        if pid == 0:
+            _run_worker(server, servers)
+        pids.add(pid)
+        # The worker owns this socket now; a copy left open here would keep receiving its
+        # share of connections, with nothing accepting them, if the worker died
+        server.server_close()
+    
+    # Let SIGTERM (systemd, docker stop) shut the workers down instead of orphaning them
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    try:
+        # Never carry on with fewer workers: stop the server once any of them exits
+        pid, status = os.wait()
+        pids.discard(pid)
+        print(f"❌ Worker {pid} exited unexpectedly (status {os.waitstatus_to_exitcode(status)}), stopping server")
+        raise SystemExit(1)
+    finally:
+        for pid in pids:
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGTERM)
+        for pid in pids:
+            with contextlib.suppress(ChildProcessError):
+                os.waitpid(pid, 0)
+
+def _file_exists(path):
+    """Check for a file with a single stat() call"""
+    try:
+        os.stat(path)
+    except FileNotFoundError:
+        return False
+    return True
 
 def main():
     port = 8000
@@ -203,9 +554,26 @@ def main():
             print(f"Invalid port number: {sys.argv[1]}")
             return
     
-    # Check if data files exist
-    data_files = ['data/hardware-database.json', 'data/configuration-tips.json']
-    missing_files = [f for f in data_files if not os.path.exists(f)]
+    # Number of worker processes sharing the port, from LXHWDB_WORKERS
+    try:
+        workers = int(os.environ.get('LXHWDB_WORKERS', '1'))
+        if workers < 1:
+            raise ValueError
+    except ValueError:
+        print(f"Invalid worker count: {os.environ['LXHWDB_WORKERS']}")
+        return
+    
+    if workers > 1 and not (hasattr(os, 'fork') and hasattr(socket, 'SO_REUSEPORT')):
+        print("⚠️  Warning: Multiple workers need fork() and SO_REUSEPORT; using a single process")
+        print()
+        workers = 1
+    
+    # Check if data files exist, once, for both the warning and the banner
+    data_files = {
+        HARDWARE_DATABASE: _file_exists(HARDWARE_DATABASE),
+        CONFIGURATION_TIPS: _file_exists(CONFIGURATION_TIPS),
+    }
+    missing_files = [f for f, found in data_files.items() if not found]
     
     if missing_files:
         print("⚠️  Warning: Missing data files:")
@@ -214,21 +582,35 @@ def main():
         print("\nThe website will still work, but no hardware data will be available.")
         print("Run the hardware detection tool to populate the database.")
         print()
+    else:
+        # Precompute the statistics (and cache both databases) before the first request
+        try:
+            _load_statistics()
+        except Exception as e:
+            print(f"⚠️  Warning: Could not precompute statistics: {e}")
+            print()
     
     try:
-        with socketserver.TCPServer(("", port), LXHWDBHandler) as httpd:
-            print(f"🌐 Linux Hardware Compatibility Database Server")
+        with contextlib.ExitStack() as stack:
+            servers = [
+                stack.enter_context(LXHWDBServer(("", port), LXHWDBHandler, reuse_port=workers > 1))
+                for _ in range(workers)
+            ]
+            
+            print("🌐 Linux Hardware Compatibility Database Server")
             print(f"📡 Server starting on http://localhost:{port}")
             print(f"📁 Serving from: {os.getcwd()}")
+            if workers > 1:
+                print(f"👷 Worker processes: {workers}")
             print()
-            print(f"🔍 Hardware Database: {'✅ Found' if os.path.exists('data/hardware-database.json') else '❌ Missing'}")
-            print(f"💡 Configuration Tips: {'✅ Found' if os.path.exists('data/configuration-tips.json') else '❌ Missing'}")
+            print(f"🔍 Hardware Database: {'✅ Found' if data_files[HARDWARE_DATABASE] else '❌ Missing'}")
+            print(f"💡 Configuration Tips: {'✅ Found' if data_files[CONFIGURATION_TIPS] else '❌ Missing'}")
             print()
             print("📖 Available endpoints:")
-            print("   - http://localhost:{port}/              (Main website)")
-            print("   - http://localhost:{port}/api/hardware   (Hardware database API)")
-            print("   - http://localhost:{port}/api/tips       (Configuration tips API)")
-            print("   - http://localhost:{port}/api/statistics (Combined statistics)")
+            print(f"   - http://localhost:{port}/              (Main website)")
+            print(f"   - http://localhost:{port}/api/hardware   (Hardware database API)")
+            print(f"   - http://localhost:{port}/api/tips       (Configuration tips API)")
+            print(f"   - http://localhost:{port}/api/statistics (Combined statistics)")
             print()
             print("⚡ To populate with real data, run the hardware detection tool:")
             print("   cargo run --bin lx-hw-detect -- --output web/data/my-hardware.json")
@@ -236,12 +618,15 @@ def main():
             print("🛑 Press Ctrl+C to stop the server")
             print("=" * 60)
             
-            httpd.serve_forever()
+            if workers > 1:
+                _run_workers(servers)
+            else:
+                servers[0].serve_forever()
             
     except KeyboardInterrupt:
         print("\n👋 Server stopped by user")
     except OSError as e:
-        if e.errno == 48:  # Address already in use
+        if e.errno == errno.EADDRINUSE:
             print(f"❌ Port {port} is already in use")
             print(f"   Try a different port: python3 serve.py {port + 1}")
         else: